@@ -6,12 +6,19 @@
  Chaque nœud représente une équipe, chaque arête une confrontation pondérée.
 ====================================================
 """
+import csv
+import os
+import numpy as np
 import pandas as pd
 import networkx as nx
 from pathlib import Path
+from scipy.sparse import csr_matrix
 
 # === Configuration du chemin vers les données ===
 DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+GRAPH_CACHE = DATA_DIR / "graph.npz"
+# À incrémenter quand la construction du graphe change (invalide le cache)
+GRAPH_CACHE_VERSION = 2
 
 def build_graph():
     """
@@ -19,32 +26,55 @@ def build_graph():
     Chaque équipe est un nœud, et chaque match une arête pondérée selon le résultat :
       - 1 point pour une victoire
       - 0.5 point pour un match nul
+    Les matchs répétés entre deux équipes cumulent leurs poids sur une même arête.
     """
     csv_path = DATA_DIR / "matches.csv"
     if not csv_path.exists():
         raise FileNotFoundError(f" Fichier introuvable : {csv_path}")
-    df = pd.read_csv(csv_path)
 
-    G = nx.DiGraph()
+    # Lecture en flux : seules les quatre colonnes utiles sont conservées
+    home, away, hg, ag = [], [], [], []
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        i_home, i_away, i_hg, i_ag = (
+            header.index(col) for col in ("home_team", "away_team", "home_team_goal", "away_team_goal")
+        )
+        for row in reader:
+            # On ignore les lignes invalides
+            if not row[i_home] or not row[i_away]:
+                continue
+            home.append(row[i_home])
+            away.append(row[i_away])
+            hg.append(int(row[i_hg]))
+            ag.append(int(row[i_ag]))
+
+    home = np.array(home, dtype=object)
+    away = np.array(away, dtype=object)
+    hg = np.array(hg, dtype=np.int16)
+    ag = np.array(ag, dtype=np.int16)
+
+    # Victoire / défaite / match nul, sans branchement (sélections np.where)
+    diff = hg.astype(np.int32) - ag
+    draw = diff == 0
+    home_wins = diff > 0
+    src = np.where(home_wins, home, away)
+    dst = np.where(home_wins, away, home)
+    w = np.where(draw, 0.5, 1.0)
 
-    for _, row in df.iterrows():
-        home = row["home_team"]
-        away = row["away_team"]
-        home_goals = row["home_team_goal"]
-        away_goals = row["away_team_goal"]
-
-        # On ignore les lignes invalides
-        if pd.isna(home) or pd.isna(away):
-            continue
-
-        # Victoire / défaite / match nul
-        if home_goals > away_goals:
-            G.add_edge(home, away, weight=1)
-        elif away_goals > home_goals:
-            G.add_edge(away, home, weight=1)
-        else:
-            G.add_edge(home, away, weight=0.5)
-            G.add_edge(away, home, weight=0.5)
+    # Les nuls ajoutent l'arête inverse
+    src = np.concatenate([src, home[draw]])
+    dst = np.concatenate([dst, away[draw]])
+    w = np.concatenate([w, np.full(draw.sum(), 0.5)])
+
+    # Confrontations répétées : les poids s'additionnent (une arête par paire orientée)
+    edges = (
+        pd.DataFrame({"s": src, "d": dst, "w": w})
+          .groupby(["s", "d"], sort=False, as_index=False)["w"].sum()
+    )
+
+    G = nx.DiGraph()
+    G.add_weighted_edges_from(edges.itertuples(index=False, name=None))
 
     print(" Graphe de football construit avec succès !")
     print(f"  {G.number_of_nodes()} équipes")
@@ -56,5 +86,53 @@ def build_graph():
         "edges": G.number_of_edges()
     }
 
+
+def graph_to_csr(G):
+    """
+    Convertit le graphe NetworkX en tableaux CSR (indptr, indices, weights).
+    Les noms d'équipes sont factorisés en entiers contigus ; la ligne i
+    contient les arêtes sortantes de l'équipe teams[i].
+    """
+    edges = nx.to_pandas_edgelist(G)
+    codes, teams = pd.factorize(pd.concat([edges["source"], edges["target"]]))
+    src, dst = codes[:len(edges)], codes[len(edges):]
+    A = csr_matrix((edges["weight"].to_numpy(dtype=float), (src, dst)), shape=(len(teams), len(teams)))
+    return A.indptr, A.indices, A.data, teams
+
+
+def load_graph_csr():
+    """
+    Renvoie le graphe au format CSR, mis en cache dans data/graph.npz.
+    Le cache est réutilisé tant qu'il est plus récent que matches.csv et
+    de la même version que GRAPH_CACHE_VERSION ;
+    sinon le graphe est reconstruit puis le cache réécrit de façon atomique.
+    """
+    csv_path = DATA_DIR / "matches.csv"
+    cached = None
+    if GRAPH_CACHE.exists() and csv_path.exists() and GRAPH_CACHE.stat().st_mtime >= csv_path.stat().st_mtime:
+        with np.load(GRAPH_CACHE) as cache:
+            if "version" in cache and int(cache["version"]) == GRAPH_CACHE_VERSION:
+                cached = tuple(cache[k] for k in ("indptr", "indices", "weights", "teams"))
+    if cached is not None:
+        indptr, indices, weights, teams = cached
+        print(f" Graphe CSR chargé depuis le cache : {GRAPH_CACHE}")
+    else:
+        G = build_graph()["graph"]
+        indptr, indices, weights, teams = graph_to_csr(G)
+        teams = np.asarray(teams, dtype=str)
+        tmp_path = GRAPH_CACHE.with_suffix(".npz.tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez(f, indptr=indptr, indices=indices, weights=weights, teams=teams, version=GRAPH_CACHE_VERSION)
+        os.replace(tmp_path, GRAPH_CACHE)
+
+    return {
+        "indptr": indptr,
+        "indices": indices,
+        "weights": weights,
+        "teams": teams,
+        "nodes": len(teams),
+        "edges": len(indices)
+    }
+
 if __name__ == "__main__":
     build_graph()
\ No newline at end of file
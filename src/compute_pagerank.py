@@ -1,22 +1,145 @@
 import networkx as nx
+import numpy as np
 import pandas as pd
-from build_graph import build_graph
+from scipy.sparse import csr_matrix
+from build_graph import load_graph_csr
 from pathlib import Path
 
 OUT = Path(__file__).resolve().parents[1] / "data"
 
+# Paramètres de convergence partagés par les scripts PageRank
+PAGERANK_TOL = 1e-6
+PAGERANK_MAX_ITER = 100
+
+# Numba optionnel : compile l'itération de puissance si disponible
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except Exception:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    # Pas de fastmath : la réassociation annulerait la compensation de Kahan
+    @njit(parallel=True, cache=True)
+    def _pr_iter(indptr, indices, weights, r, r_new, alpha, teleport):
+        """Une itération r_new = alpha * M r + teleport ; renvoie l'écart L1."""
+        err = 0.0
+        for i in prange(r.shape[0]):
+            # Somme compensée (Kahan) des contributions entrantes
+            s = 0.0
+            c = 0.0
+            for k in range(indptr[i], indptr[i + 1]):
+                y = weights[k] * r[indices[k]] - c
+                t = s + y
+                c = (t - s) - y
+                s = t
+            r_new[i] = alpha * s + teleport
+            err += abs(r_new[i] - r[i])
+        return err
+
+# igraph optionnel : PageRank en C (PRPACK) sur la même représentation entière
+try:
+    import igraph as ig
+    IGRAPH_AVAILABLE = True
+except Exception:
+    IGRAPH_AVAILABLE = False
+
+# pyarrow optionnel : écriture CSV en C++ plutôt que DataFrame.to_csv
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except Exception:
+    PYARROW_AVAILABLE = False
+
+
+def write_csv(df, path):
+    """Écrit le DataFrame en CSV (sans index), via pyarrow lorsqu'il est installé."""
+    if not PYARROW_AVAILABLE:
+        df.to_csv(path, index=False)
+        return
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pa_csv.write_csv(table, str(path))
+
+
+def pagerank_csr(indptr, indices, weights, N, alpha=0.85, tol=PAGERANK_TOL, max_iter=PAGERANK_MAX_ITER, dtype=np.float32):
+    """
+    PageRank par itération de puissance sur une matrice creuse CSR.
+    Mêmes conventions que nx.pagerank : poids normalisés par le poids sortant,
+    masse des nœuds sans arête sortante redistribuée uniformément,
+    arrêt lorsque l'écart L1 entre deux itérations passe sous N * tol,
+    ou dès qu'il cesse de diminuer (plancher de précision du float32 atteint).
+    L'itération est compilée avec Numba lorsqu'il est installé ; poids et
+    scores sont stockés en float32 par défaut (moitié moins de mémoire lue).
+    Retourne le vecteur des scores (numpy float64, taille N).
+    """
+    src = np.repeat(np.arange(N), np.diff(indptr))
+    out_w = np.bincount(src, weights=weights, minlength=N)
+    inv_out = np.divide(1.0, out_w, out=np.zeros(N), where=out_w != 0)
+    # Indices des nœuds sans arête sortante, calculés une fois : la masse à
+    # redistribuer ne parcourt ensuite que ces nœuds à chaque itération
+    dangling = np.flatnonzero(out_w == 0)
+    # Matrice de transition transposée : M[dst, src] = w / poids sortant de src
+    M = csr_matrix(((weights * inv_out[src]).astype(dtype), (indices, src)), shape=(N, N))
+
+    r = np.full(N, 1.0 / N, dtype=dtype)
+    teleport = (1 - alpha) / N
+    if NUMBA_AVAILABLE:
+        r_new = np.empty(N, dtype=dtype)
+        prev_err = np.inf
+        for _ in range(max_iter):
+            shift = alpha * r[dangling].sum() / N + teleport
+            err = _pr_iter(M.indptr, M.indices, M.data, r, r_new, alpha, shift)
+            r, r_new = r_new, r
+            if err < N * tol or err >= prev_err:
+                return r.astype(np.float64)
+            prev_err = err
+        raise nx.PowerIterationFailedConvergence(max_iter)
+
+    # Deux vecteurs réutilisés d'une itération à l'autre
+    r_new = np.empty(N, dtype=dtype)
+    diff = np.empty(N, dtype=dtype)
+    prev_err = np.inf
+    for _ in range(max_iter):
+        shift = alpha * r[dangling].sum() / N + teleport
+        r_new[:] = M.dot(r)
+        r_new *= alpha
+        r_new += shift
+        np.subtract(r_new, r, out=diff)
+        r, r_new = r_new, r
+        err = np.abs(diff, out=diff).sum()
+        if err < N * tol or err >= prev_err:
+            return r.astype(np.float64)
+        prev_err = err
+    raise nx.PowerIterationFailedConvergence(max_iter)
+
+
+def pagerank_igraph(indptr, indices, weights, N, alpha=0.85, tol=PAGERANK_TOL, max_iter=PAGERANK_MAX_ITER):
+    """
+    PageRank calculé par igraph à partir des mêmes tableaux CSR que pagerank_csr.
+    La résolution est directe (PRPACK) : tol et max_iter sont ignorés.
+    """
+    src = np.repeat(np.arange(N), np.diff(indptr))
+    g = ig.Graph(n=N, edges=np.column_stack([src, indices]).tolist(), directed=True)
+    return np.asarray(g.pagerank(damping=alpha, weights=np.asarray(weights).tolist()))
+
+
+# Backend utilisé par les scripts : igraph s'il est installé, sinon la version CSR
+pagerank = pagerank_igraph if IGRAPH_AVAILABLE else pagerank_csr
+
+
 if __name__ == "__main__":
-    graph_data = build_graph()
-    G = graph_data["graph"]
+    graph_data = load_graph_csr()
     print(f" Graphe chargé : {graph_data['nodes']} équipes, {graph_data['edges']} matchs\n")
 
     print(" Calcul du PageRank en cours...")
-    pagerank_scores = nx.pagerank(G, alpha=0.85)
-    df = pd.DataFrame(pagerank_scores.items(), columns=["team", "pagerank"])
+    teams = graph_data["teams"]
+    scores = pagerank(graph_data["indptr"], graph_data["indices"], graph_data["weights"], len(teams), alpha=0.85, tol=PAGERANK_TOL, max_iter=PAGERANK_MAX_ITER)
+    df = pd.DataFrame({"team": teams, "pagerank": scores})
     df = df.sort_values("pagerank", ascending=False)
 
     out_path = OUT / "team_pagerank.csv"
-    df.to_csv(out_path, index=False)
+    write_csv(df, out_path)
 
     print(f" Résultats sauvegardés → {out_path}")
     print("\n🏆 Top 10 équipes selon le PageRank :\n")
@@ -1,41 +1,109 @@
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 import pandas as pd
-import networkx as nx
+from scipy.sparse import csr_matrix
+from compute_pagerank import pagerank, write_csv, PAGERANK_TOL, PAGERANK_MAX_ITER
 from pathlib import Path
 
-DATA_PATH = Path(__file__).resolve().parents[1] / "data" / "matches_with_league.csv"
+# Moteur de lecture CSV PyArrow (optionnel, multi-thread)
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
+
+CSV_PATH = Path(__file__).resolve().parents[1] / "data" / "matches_with_league.csv"
+PARQUET_PATH = CSV_PATH.with_suffix(".parquet")
+# Export le plus récent de extract_data.py : Parquet (avec pyarrow) ou CSV
+DATA_PATH = max(
+    (p for p in (PARQUET_PATH, CSV_PATH) if p.exists()),
+    key=lambda p: p.stat().st_mtime,
+    default=CSV_PATH,
+)
 OUTPUT_PATH = Path(__file__).resolve().parents[1] / "data" / "team_pagerank_with_league.csv"
 
-df = pd.read_csv(DATA_PATH)
-print(f"{len(df)} matchs chargés depuis {DATA_PATH}")
-print(f"Colonnes disponibles : {list(df.columns)}")
-seasons = sorted(df["season"].unique())
-results = []
-
-for season in seasons:
-    matches = df[df["season"] == season]
-    G = nx.DiGraph()
-    for _, row in matches.iterrows():
-        if row["home_score"] > row["away_score"]:
-            G.add_edge(row["home_team"], row["away_team"])
-        elif row["home_score"] < row["away_score"]:
-            G.add_edge(row["away_team"], row["home_team"])
-    if len(G) == 0:
-        continue
-    pr = nx.pagerank(G, alpha=0.85)
-    for team, score in pr.items():
-        subset_home = matches[matches["home_team"] == team]
-        subset_away = matches[matches["away_team"] == team]
-        leagues = pd.concat([subset_home["league_name"], subset_away["league_name"]]).dropna().unique()
-        countries = pd.concat([subset_home["country_name"], subset_away["country_name"]]).dropna().unique()
-        league = leagues[0] if len(leagues) > 0 else None
-        country = countries[0] if len(countries) > 0 else None
-        results.append({
-            "season": season,
-            "team": team,
-            "pagerank": score,
-            "league": league,
-            "country": country
-        })
-
-pd.DataFrame(results).to_csv(OUTPUT_PATH, index=False)
-print(f"Fichier sauvegardé : {OUTPUT_PATH}")
\ No newline at end of file
+
+def solve_season(args):
+    """
+    PageRank d'une saison à partir de ses arêtes vainqueur → perdant (codes d'équipe).
+    Exécutée dans un processus séparé : renvoie (codes des équipes, scores).
+    """
+    season_winners, season_losers = args
+    # Numérotation locale des équipes de la saison, par ordre d'apparition
+    local, nodes = pd.factorize(np.column_stack([season_winners, season_losers]).ravel())
+    N = len(nodes)
+    if N == 0:
+        return nodes, np.empty(0)
+    # Confrontations répétées : les doublons sont sommés à la conversion CSR
+    # (poids = nombre de victoires sur cet adversaire dans la saison)
+    A = csr_matrix((np.ones(len(season_winners)), (local[0::2], local[1::2])), shape=(N, N))
+    return nodes, pagerank(A.indptr, A.indices, A.data, N, alpha=0.85, tol=PAGERANK_TOL, max_iter=PAGERANK_MAX_ITER)
+
+
+if __name__ == "__main__":
+    columns = ["season", "league_name", "country_name", "home_team", "away_team", "home_score", "away_score"]
+    if DATA_PATH.suffix == ".parquet":
+        # Colonnes déjà typées dans le fichier (scores int8)
+        df = pd.read_parquet(DATA_PATH, columns=columns)
+    else:
+        df = pd.read_csv(
+            DATA_PATH,
+            usecols=columns,
+            dtype={
+                "home_team": "category", "away_team": "category",
+                "home_score": "int16", "away_score": "int16",
+            },
+            engine=CSV_ENGINE,
+        )
+    print(f"{len(df)} matchs chargés depuis {DATA_PATH}")
+    print(f"Colonnes disponibles : {list(df.columns)}")
+
+    # Conversion unique : équipes en codes entiers int32 (buts déjà lus en int16)
+    team_codes, team_names = pd.factorize(pd.concat([df["home_team"], df["away_team"]]))
+    df["home_code"] = team_codes[:len(df)].astype("int32")
+    df["away_code"] = team_codes[len(df):].astype("int32")
+    season_codes, season_names = pd.factorize(df["season"], sort=True)
+
+    # Arêtes du vainqueur vers le perdant sur toute la base, matchs nuls ignorés
+    home_score = df["home_score"].to_numpy()
+    away_score = df["away_score"].to_numpy()
+    decisive = home_score != away_score
+    home_win = home_score > away_score
+    winners = np.where(home_win, df["home_code"], df["away_code"])[decisive]
+    losers = np.where(home_win, df["away_code"], df["home_code"])[decisive]
+    edge_season = season_codes[decisive]
+
+    # Tri unique par saison (stable : ordre des lignes conservé dans chaque saison),
+    # puis bornes de chaque saison dans les tableaux d'arêtes
+    order = np.argsort(edge_season, kind="stable")
+    winners, losers, edge_season = winners[order], losers[order], edge_season[order]
+    bounds = np.searchsorted(edge_season, np.arange(len(season_names) + 1))
+
+    # Première ligue / premier pays connus par (saison, équipe) : domicile puis extérieur
+    # (table haute construite directement à partir des tableaux, clés entières)
+    stacked = pd.DataFrame({
+        "season": np.tile(season_codes, 2),
+        "code": np.concatenate([df["home_code"].to_numpy(), df["away_code"].to_numpy()]),
+        "league_name": np.tile(df["league_name"].to_numpy(), 2),
+        "country_name": np.tile(df["country_name"].to_numpy(), 2),
+    })
+    teams_meta = stacked.groupby(["season", "code"]).first()
+    results = []
+
+    # Saisons indépendantes : une tâche par saison, réparties sur les cœurs
+    season_args = [(winners[bounds[s]:bounds[s + 1]], losers[bounds[s]:bounds[s + 1]]) for s in range(len(season_names))]
+    with ProcessPoolExecutor() as ex:
+        for s, (nodes, scores) in enumerate(ex.map(solve_season, season_args)):
+            # Scores en tableaux indexés par code : les noms ne sont résolus qu'ici
+            season = season_names[s]
+            meta = teams_meta.loc[s].reindex(nodes)
+            results.append(pd.DataFrame({
+                "season": season,
+                "team": team_names[nodes],
+                "pagerank": scores,
+                "league": meta["league_name"].to_numpy(),
+                "country": meta["country_name"].to_numpy(),
+            }))
+
+    write_csv(pd.concat(results, ignore_index=True), OUTPUT_PATH)
+    print(f"Fichier sauvegardé : {OUTPUT_PATH}")
\ No newline at end of file
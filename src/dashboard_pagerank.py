@@ -1,27 +1,94 @@
 
 import dash
-from dash import dcc, html, Input, Output
-import plotly.express as px
+from dash import dcc, html, Input, Output, Patch, ctx
+from flask import request
 import pandas as pd
+from plotly.colors import qualitative
 from pathlib import Path
 import dash_bootstrap_components as dbc
-import webbrowser
 import numpy as np
 import logging
 from datetime import datetime
+from functools import lru_cache
 
+import base64
+import importlib.util
 import io
+import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
-# Optional PDF dependency 
-try:
+# Optional PDF dependency (détectée sans l'importer : chargée au premier PDF)
+REPORTLAB_AVAILABLE = importlib.util.find_spec("reportlab") is not None
+# Compression HTTP optionnelle (dash[compress])
+FLASK_COMPRESS_AVAILABLE = importlib.util.find_spec("flask_compress") is not None
+
+
+@lru_cache(maxsize=None)
+def _lazy_load_reportlab():
+    """Importe une seule fois les modules reportlab utilisés par le résumé PDF."""
     from reportlab.lib.pagesizes import A4
     from reportlab.pdfgen import canvas
     from reportlab.lib.units import cm
     from reportlab.lib import colors
-    REPORTLAB_AVAILABLE = True
-except Exception:
-    REPORTLAB_AVAILABLE = False
+    return {"A4": A4, "canvas": canvas, "cm": cm, "colors": colors}
+
+# Numba optionnel : statistiques de dispersion compilées (sinon NumPy).
+# Détecté sans l'importer : numba (~150 ms d'import) est chargé hors du démarrage
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+
+def _score_stats_np(p):
+    """(moyenne, écart-type, somme, entropie de Shannon, somme des 3 premiers) des scores p, version NumPy."""
+    p = p.astype(np.float64)
+    total = p.sum()
+    probs = np.clip(p / total, 1e-12, None)
+    return p.mean(), p.std(), total, -(probs * np.log(probs)).sum(), p[:3].sum()
+
+
+@lru_cache(maxsize=None)
+def _score_stats_kernel():
+    """Importe numba et compile (ou relit du cache disque) une seule fois le noyau
+    des statistiques ; version NumPy si numba est absent ou inutilisable."""
+    if not NUMBA_AVAILABLE:
+        return _score_stats_np
+    try:
+        from numba import njit
+    except Exception:
+        return _score_stats_np
+
+    @njit(cache=True, error_model="numpy")
+    def score_stats(p):
+        """(moyenne, écart-type, somme, entropie de Shannon, somme des 3 premiers)
+        des scores p en deux passes fusionnées, accumulées en float64."""
+        n = p.shape[0]
+        total = 0.0
+        top3 = 0.0
+        for i in range(n):
+            total += p[i]
+            if i < 3:
+                top3 += p[i]
+        mean = total / n
+        var = 0.0
+        entropy = 0.0
+        for i in range(n):
+            d = p[i] - mean
+            var += d * d
+            # Probabilités bornées à 1e-12 (comme le clip de la version NumPy)
+            q = max(p[i] / total, 1e-12)
+            entropy -= q * np.log(q)
+        return mean, np.sqrt(var / n), total, entropy, top3
+
+    # Spécialisation float32 (dtype des scores chargés) compilée dès maintenant
+    score_stats(np.ones(3, dtype=np.float32))
+    return score_stats
+
+
+def _score_stats(p):
+    """Statistiques des scores p par le noyau Numba s'il est disponible, sinon NumPy."""
+    return _score_stats_kernel()(p)
+
 
 #  Couleurs principales 
 PRIMARY_COLOR = "#1A5276"
@@ -29,6 +96,27 @@ SECONDARY_COLOR = "#1ABC9C"
 BACKGROUND_COLOR = "#F4F6F7"
 CARD_BG = "#FFFFFF"
 TEXT_COLOR = "#2C3E50"
+# Seules couleurs du callback principal qui dépendent du thème (clair, sombre) :
+# histogramme de distribution et camembert Top 3 / Reste
+DIST_COLORS = {False: "#2ECC71", True: "#F4D03F"}
+PIE_COLORS = {False: ("#1ABC9C", "#95A5A6"), True: ("#F39C12", "#5D6D7E")}
+# Palette pastel des barres Ligue / Pays, étendue une fois aux 15 barres du Top 15
+PASTEL_TOP15 = tuple((qualitative.Pastel2 * 2)[:15])
+
+#  Mise en forme commune des figures (thème clair forcé) 
+# Dicts partagés par référence : Plotly les recopie à la validation sans les modifier
+BASE_FONT = {"color": TEXT_COLOR}
+TITLE_FONT = {"size": 22, "color": PRIMARY_COLOR, "family": "Lato, sans-serif"}
+HOVERLABEL = {"bgcolor": "#F9FAFB", "font": {"size": 13}}
+MARGIN_COMPACT = {"l": 40, "r": 40, "t": 60, "b": 40}
+BASE_LAYOUT = {
+    "template": "plotly_white",
+    "plot_bgcolor": "#FFFFFF",
+    "paper_bgcolor": "#FFFFFF",
+    "font": BASE_FONT,
+    "title_x": 0.5,
+    "title_font": TITLE_FONT,
+}
 
 logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
 
@@ -42,22 +130,87 @@ if not DATA_PATH.exists():
     print("👉 Exécute d'abord 'compute_pagerank.py' pour le générer.")
     exit(1)
 
+# Moteur de lecture CSV PyArrow (optionnel, multi-thread)
 try:
-    df = pd.read_csv(DATA_PATH)
-    df.columns = df.columns.str.strip()
-    df.rename(columns={
-        " Team": "team", " team": "team",
-        "Pagerank": "pagerank", " Pagerank": "pagerank"
-    }, inplace=True)
-    df["team"] = df["team"].astype(str)
-    df["pagerank"] = pd.to_numeric(df["pagerank"], errors="coerce")
-    # Remplissage des colonnes 'league' et 'country' si elles existent
-    if 'league' in df.columns:
-        df['league'] = df['league'].fillna('Inconnue')
-    if 'country' in df.columns:
-        df['country'] = df['country'].fillna('Inconnu')
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
+
+# Variantes d'en-têtes rencontrées dans les CSV → nom de colonne normalisé
+COLUMN_ALIASES = {"Team": "team", "Pagerank": "pagerank", "Saison": "season"}
+PAGERANK_DTYPES = {"season": "str", "team": "str", "pagerank": "float64", "league": "str", "country": "str"}
+YEARLY_DTYPES = {"season": "str", "team": "str", "pagerank": "float64"}
+
+
+def _read_typed_csv(csv_path, dtypes):
+    """Lit csv_path en une seule passe typée : seules les colonnes de dtypes
+    (après normalisation des en-têtes) sont lues, directement avec leur type."""
+    header = pd.read_csv(csv_path, nrows=0).columns
+    names = {c: COLUMN_ALIASES.get(c.strip(), c.strip()) for c in header}
+    usecols = [c for c in header if names[c] in dtypes]
+    data = pd.read_csv(
+        csv_path,
+        usecols=usecols,
+        dtype={c: dtypes[names[c]] for c in usecols},
+        engine=CSV_ENGINE,
+    )
+    return data.rename(columns=names)
+
+
+# Libellé des valeurs manquantes par colonne texte (None : laissées telles quelles)
+TEXT_FILL = {"team": None, "league": "Inconnue", "country": "Inconnu"}
+
+
+def _compact_dtypes(data):
+    """Scores en float32 ; identifiants (équipe, ligue, pays) nettoyés une fois
+    (espaces, valeurs manquantes) puis stockés en catégories."""
+    data["pagerank"] = data["pagerank"].astype(np.float32)
+    for col, fill in TEXT_FILL.items():
+        if col in data.columns:
+            values = data[col].astype("string").str.strip()
+            if fill is not None:
+                values = values.fillna(fill)
+            data[col] = values.astype("category")
+    return data
+
+
+def _clean_pagerank(df):
+    """Écarte les scores manquants du CSV PageRank et trie par score."""
     df.dropna(subset=["pagerank"], inplace=True)
     df.sort_values("pagerank", ascending=False, inplace=True)
+    return _compact_dtypes(df)
+
+
+def _clean_yearly(df_yearly):
+    """Écarte les lignes incomplètes du CSV annuel (équipe, saison, score)."""
+    df_yearly.dropna(subset=["pagerank", "team", "season"], inplace=True)
+    return _compact_dtypes(df_yearly)
+
+
+def _load_cached(csv_path, dtypes, clean):
+    """Charge csv_path (colonnes typées selon dtypes) nettoyé par clean(), via un cache Parquet voisin.
+    Le cache est relu tant qu'il est plus récent que le CSV et que ce module
+    (qui définit le nettoyage) ; sinon le CSV est relu, nettoyé, puis le cache
+    réécrit (ignoré si pyarrow est absent).
+    """
+    cache = csv_path.with_suffix(".parquet")
+    source_mtime = max(csv_path.stat().st_mtime, Path(__file__).stat().st_mtime)
+    if cache.exists() and cache.stat().st_mtime >= source_mtime:
+        try:
+            return pd.read_parquet(cache)
+        except Exception as e:
+            logging.warning(f"Cache {cache} illisible, relecture du CSV : {e}")
+    data = clean(_read_typed_csv(csv_path, dtypes))
+    try:
+        data.to_parquet(cache, compression="zstd")
+    except Exception as e:
+        logging.warning(f"Cache Parquet non écrit ({cache}) : {e}")
+    return data
+
+
+try:
+    df = _load_cached(DATA_PATH, PAGERANK_DTYPES, _clean_pagerank)
     print(f" Données chargées : {len(df)} équipes importées depuis {DATA_PATH}.")
 except Exception as e:
     print(f" Erreur lors du chargement du fichier CSV : {e}")
@@ -66,17 +219,7 @@ except Exception as e:
 # Chargement du CSV annuel (optionnel)
 if YEARLY_PATH.exists():
     try:
-        df_yearly = pd.read_csv(YEARLY_PATH)
-        df_yearly.columns = df_yearly.columns.str.strip()
-        df_yearly.rename(columns={
-            " Team": "team", " team": "team",
-            "Pagerank": "pagerank", " Pagerank": "pagerank",
-            "Saison": "season", " Saison": "season", "season": "season"
-        }, inplace=True)
-        df_yearly["team"] = df_yearly["team"].astype(str)
-        df_yearly["pagerank"] = pd.to_numeric(df_yearly["pagerank"], errors="coerce")
-        df_yearly["season"] = df_yearly["season"].astype(str)
-        df_yearly.dropna(subset=["pagerank", "team", "season"], inplace=True)
+        df_yearly = _load_cached(YEARLY_PATH, YEARLY_DTYPES, _clean_yearly)
         logging.info(f"➡️ Données annuelles chargées : {len(df_yearly)} lignes depuis {YEARLY_PATH}")
     except Exception as e:
         logging.warning(f"Impossible de lire {YEARLY_PATH}: {e}")
@@ -85,6 +228,16 @@ else:
     logging.info("(optionnel) Fichier annuel introuvable : section 'Évolution' masquée tant qu'il n'est pas généré.")
     df_yearly = pd.DataFrame(columns=["team", "season", "pagerank"])    
 
+# Séries annuelles indexées par club, triées par saison une fois pour toutes :
+# le callback d'évolution n'a plus qu'une recherche dans le dictionnaire
+YEARLY_BY_TEAM = {
+    team: (g["season"].to_numpy(), g["pagerank"].to_numpy())
+    for team, g in df_yearly.sort_values("season", kind="stable").groupby("team", sort=False, observed=True)
+}
+# Liste triée des clubs du sélecteur d'évolution (options construites une fois)
+YEARLY_TEAMS = sorted(YEARLY_BY_TEAM)
+YEARLY_OPTIONS = [{"label": club, "value": club} for club in YEARLY_TEAMS]
+
 #  Application Dash 
 app = dash.Dash(
     __name__,
@@ -92,21 +245,46 @@ app = dash.Dash(
     assets_url_path="/assets",
     external_stylesheets=[dbc.themes.MINTY, "https://fonts.googleapis.com/css2?family=Lato:wght@400;700&display=swap"],
     suppress_callback_exceptions=True,
+    # Réponses gzip/brotli (bundles JS, CSS, JSON des callbacks) si flask-compress est installé
+    compress=FLASK_COMPRESS_AVAILABLE,
 )
 # (Backup toggle in case the runtime changes)
 app.config.suppress_callback_exceptions = True
 app.title = "Football PageRank"
 
-#  KPIs dynamiques 
+
+@app.server.after_request
+def _cache_fingerprinted_assets(response):
+    """Cache long pour les assets référencés avec leur date de modification
+    (?m=..., ajouté par Dash aux CSS/JS du dossier assets) : une modification
+    change l'URL, le navigateur ne revalide donc jamais inutilement."""
+    if request.path.startswith("/assets/") and "m" in request.args and response.status_code == 200:
+        response.cache_control.no_cache = None
+        response.cache_control.public = True
+        response.cache_control.max_age = 31536000
+    return response
+
+#  KPIs dynamiques (calculés une seule fois au chargement) 
+KPIS = {
+    "total_teams": len(df),
+    "top_team": df.iloc[0]["team"] if not df.empty else "N/A",
+    "avg_rank": df["pagerank"].mean() if not df.empty else 0,
+    "most_common_country": df['country'].mode()[0] if 'country' in df.columns and not df.empty else 'N/A',
+}
+
 def get_kpis():
-    total_teams = len(df)
-    top_team = df.iloc[0]["team"] if not df.empty else "N/A"
-    avg_rank = df["pagerank"].mean() if not df.empty else 0
-    most_common_country = df['country'].mode()[0] if 'country' in df.columns and not df.empty else 'N/A'
-    return total_teams, top_team, avg_rank, most_common_country
+    return KPIS["total_teams"], KPIS["top_team"], KPIS["avg_rank"], KPIS["most_common_country"]
 
 total_teams, top_team, avg_rank, most_common_country = get_kpis()
 
+# Cartes KPI de l'onglet principal : (titre, valeur affichée, couleur)
+KPI_CARDS = [
+    ("Nombre total d’équipes", f"{total_teams:,}", "info"),
+    ("Meilleur club (PageRank max)", top_team, "success"),
+    ("Score moyen de PageRank", f"{avg_rank:.6f}", "warning"),
+    ("Pays le plus représenté", most_common_country, "primary"),
+]
+
 is_night = False
 # Initialize switch default
 app._force_default_theme_dark = False
@@ -135,9 +313,17 @@ def kpi_card(title, value, color, icon):
 def build_summary_pdf_bytes():
     """Return bytes for a 1‑page PDF summary of the project.
     Requires reportlab; if unavailable, raise RuntimeError to trigger fallback.
+    The PDF is rebuilt at most once per minute (its only time-dependent field).
     """
+    return _summary_pdf_bytes(datetime.now().strftime('%Y-%m-%d %H:%M'))
+
+
+@lru_cache(maxsize=4)
+def _summary_pdf_bytes(generated_at):
     if not REPORTLAB_AVAILABLE:
         raise RuntimeError("reportlab not installed")
+    rl = _lazy_load_reportlab()
+    A4, canvas, cm, colors = rl["A4"], rl["canvas"], rl["cm"], rl["colors"]
     buffer = io.BytesIO()
     c = canvas.Canvas(buffer, pagesize=A4)
     width, height = A4
@@ -149,7 +335,7 @@ def build_summary_pdf_bytes():
 
     c.setFillColor(colors.black)
     c.setFont("Helvetica", 10)
-    c.drawString(2*cm, height - 3.0*cm, f"Généré le: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+    c.drawString(2*cm, height - 3.0*cm, f"Généré le: {generated_at}")
 
     # Separator line
     c.setStrokeColor(colors.HexColor("#1ABC9C"))
@@ -157,16 +343,15 @@ def build_summary_pdf_bytes():
     c.line(2*cm, height - 3.3*cm, width - 2*cm, height - 3.3*cm)
 
     # Body
-    text = c.beginText(2*cm, height - 4.2*cm)
-    text.setFont("Helvetica", 11)
+    c.setFont("Helvetica", 11)
     lines = [
         "Objectif : appliquer PageRank au graphe des matchs européens (2008–2016)",
         "pour estimer l'influence structurelle des clubs (modèle perdant → gagnant).",
         "",
-        f"Équipes totales : {len(df):,}",
-        f"Meilleur club (PageRank max) : {df.iloc[0]['team'] if not df.empty else 'N/A'}",
-        f"Score moyen de PageRank : {df['pagerank'].mean():.6f}",
-        (f"Pays le plus représenté : {df['country'].mode()[0]}" if 'country' in df.columns and not df.empty else ""),
+        f"Équipes totales : {KPIS['total_teams']:,}",
+        f"Meilleur club (PageRank max) : {KPIS['top_team']}",
+        f"Score moyen de PageRank : {KPIS['avg_rank']:.6f}",
+        (f"Pays le plus représenté : {KPIS['most_common_country']}" if 'country' in df.columns and not df.empty else ""),
         "",
         "Méthodologie :",
         "  • Graphe dirigé; arête du perdant vers le gagnant (nuls bidirectionnels)",
@@ -176,9 +361,13 @@ def build_summary_pdf_bytes():
         "Interprétation : les scores reflètent la centralité/influence réseau,",
         "pas un classement sportif officiel.",
     ]
+    # Lignes posées directement à interligne fixe (même pas que textLine : 1.2 × corps)
+    leading = 1.2 * 11
+    y = height - 4.2*cm
     for line in lines:
-        text.textLine(line)
-    c.drawText(text)
+        if line:
+            c.drawString(2*cm, y, line)
+        y -= leading
 
     # Footer
     c.setFont("Helvetica-Oblique", 10)
@@ -193,16 +382,21 @@ def build_summary_pdf_bytes():
 
 
 def build_summary_txt_bytes():
-    """Fallback plain‑text summary when ReportLab is not installed."""
+    """Fallback plain‑text summary when ReportLab is not installed (cached per minute too)."""
+    return _summary_txt_bytes(datetime.now().strftime('%Y-%m-%d %H:%M'))
+
+
+@lru_cache(maxsize=4)
+def _summary_txt_bytes(generated_at):
     content = (
         "Football PageRank — Résumé projet\n"
-        f"Généré le: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n\n"
+        f"Généré le: {generated_at}\n\n"
         "Objectif : appliquer PageRank au graphe des matchs européens (2008–2016)\n"
         "pour estimer l'influence structurelle des clubs (modèle perdant → gagnant).\n\n"
-        f"Équipes totales : {len(df):,}\n"
-        f"Meilleur club (PageRank max) : {df.iloc[0]['team'] if not df.empty else 'N/A'}\n"
-        f"Score moyen de PageRank : {df['pagerank'].mean():.6f}\n"
-        + (f"Pays le plus représenté : {df['country'].mode()[0]}\n" if 'country' in df.columns and not df.empty else "") +
+        f"Équipes totales : {KPIS['total_teams']:,}\n"
+        f"Meilleur club (PageRank max) : {KPIS['top_team']}\n"
+        f"Score moyen de PageRank : {KPIS['avg_rank']:.6f}\n"
+        + (f"Pays le plus représenté : {KPIS['most_common_country']}\n" if 'country' in df.columns and not df.empty else "") +
         "\nMéthodologie :\n"
         "  • Graphe dirigé; arête du perdant vers le gagnant (nuls bidirectionnels)\n"
         "  • Algorithmie : NetworkX PageRank (α = 0.85)\n"
@@ -213,94 +407,239 @@ def build_summary_txt_bytes():
     )
     return content.encode("utf-8")
 
-# Helper pour générer la figure comparative Ligue / Pays (simplifiée et corrigée) 
-def build_compare_figures(dim="country", is_dark=False):
-    import plotly.express as px
+# Préchauffage : le premier clic de téléchargement sert directement les octets en cache
+# (en arrière-plan, pour ne pas charger reportlab sur le chemin de démarrage)
+def _warm_summary():
+    try:
+        build_summary_pdf_bytes() if REPORTLAB_AVAILABLE else build_summary_txt_bytes()
+    except Exception as e:
+        logging.warning(f"Résumé non pré-généré : {e}")
 
-    # Nettoyage et uniformisation
-    d = df.copy()
-    d.columns = d.columns.str.strip().str.lower()
-    for col in ["league", "country"]:
-        if col in d.columns:
-            d[col] = d[col].fillna("Inconnu").astype(str).str.strip()
 
-    # Validation
-    if dim not in d.columns:
-        fig = px.bar(title=f"⚠️ Colonne '{dim}' absente.")
-        # Force light theme
-        fig.update_layout(template="plotly_white", plot_bgcolor="#FFFFFF", paper_bgcolor="#FFFFFF", font=dict(color="#2C3E50"))
-        return fig
+threading.Thread(target=_warm_summary, daemon=True).start()
 
-    # Force theme to light mode and pastel colors
-    template = "plotly_white"
-    bg = "#FFFFFF"
-    font_color = "#2C3E50"
-    palette = px.colors.qualitative.Pastel2
+# Agrégation Ligue / Pays : calculée une seule fois par dimension au chargement
+def _build_agg(data, dim):
+    """Somme du PageRank et effectif par `dim`, filtrés (effectif minimal) et limités au Top 15.
+    Renvoie None si la colonne est absente.
+    """
+    # Validation (noms de colonnes déjà normalisés au chargement)
+    if dim not in data.columns:
+        return None
 
-    label = "Ligue" if dim == "league" else "Pays"
+    # Vue sur les seules colonnes utiles (`dim` déjà nettoyé au chargement) ;
+    # scores float32 stockés, sommés en float64
+    d = data[[dim, "pagerank", "team"]]
+    d = d.assign(pagerank=d["pagerank"].astype(np.float64))
 
     # Agrégation : somme du PageRank + effectif, filtre par effectif minimal
     grp = (
-        d.groupby(dim, as_index=False)
+        d.groupby(dim, as_index=False, observed=True)
          .agg(pagerank=("pagerank", "sum"), n=("team", "count"))
     )
     min_count = 5 if dim == "country" else 8
     grp = grp[grp["n"] >= min_count]
 
-    if grp.empty:
-        fig = px.bar(title=f"Aucune donnée suffisante par {label} (n≥{min_count}).")
-        fig.update_layout(template=template, plot_bgcolor=bg, paper_bgcolor=bg, font=dict(color=font_color))
-        return fig
-
     # Mise à l'échelle pour rendre les différences visibles (ppm)
     grp = grp.sort_values("pagerank", ascending=False).head(15)
     grp["pagerank_ppm"] = grp["pagerank"] * 1_000_000  # parties par million
     # Format label: round to 0 decimals, thousands separator (space)
-    grp["pagerank_ppm_label"] = grp["pagerank_ppm"].map(lambda x: f"{x:,.0f}".replace(",", " "))
-    grp["pagerank_label"] = grp["pagerank"].map(lambda x: f"{x:.6f}")
-
-    fig = px.bar(
-        grp,
-        x=dim,
-        y="pagerank_ppm",
-        color=dim,
-        title=f"Influence totale (somme des scores PageRank) par {label} (Top 15)",
-        labels={dim: label, "pagerank_ppm": "Somme du PageRank (ppm)"},
-        text="pagerank_ppm_label",
-        color_discrete_sequence=palette,
+    grp["pagerank_ppm_label"] = (
+        grp["pagerank_ppm"].round().astype("int64").map("{:,}".format).str.replace(",", " ", regex=False)
     )
+    grp["pagerank_label"] = grp["pagerank"].map("{:.6f}".format)
+    return grp
 
-    # Label propre : entier en ppm + hover détaillé
-    fig.update_traces(
+# Tables agrégées (Top 15, libellés déjà formatés) de chaque dimension présente ;
+# les figures Ligue / Pays ne font plus que les lire
+PRECOMP_COMPARE = {dim: _build_agg(df, dim) for dim in ("country", "league") if dim in df.columns}
+
+# Helper pour générer la figure comparative Ligue / Pays (simplifiée et corrigée) 
+def build_compare_figures(dim="country", is_dark=False):
+    import plotly.graph_objects as go
+
+    grp = PRECOMP_COMPARE.get(dim)
+
+    # Validation (dimension absente du CSV ou inconnue)
+    if grp is None:
+        # Force light theme
+        return go.Figure(layout=dict(
+            title=f"⚠️ Colonne '{dim}' absente.",
+            template="plotly_white", plot_bgcolor="#FFFFFF", paper_bgcolor="#FFFFFF", font=BASE_FONT,
+        ))
+
+    # Force theme to light mode and pastel colors
+    template = "plotly_white"
+    bg = "#FFFFFF"
+    font_color = "#2C3E50"
+    label = "Ligue" if dim == "league" else "Pays"
+
+    if grp.empty:
+        min_count = 5 if dim == "country" else 8
+        return go.Figure(layout=dict(
+            title=f"Aucune donnée suffisante par {label} (n≥{min_count}).",
+            template=template, plot_bgcolor=bg, paper_bgcolor=bg, font=dict(color=font_color),
+        ))
+
+    # Une seule trace : une couleur de la palette par barre
+    bar = go.Bar(
+        x=grp[dim].to_numpy(),
+        y=grp["pagerank_ppm"].to_numpy(),
+        text=grp["pagerank_ppm_label"].to_numpy(),
+        # Label propre : entier en ppm + hover détaillé
         texttemplate="%{text}",
         textposition="outside",
-        marker_line_color="#E5E8E8",
-        marker_line_width=1.2,
+        marker=dict(
+            color=PASTEL_TOP15[:len(grp)],
+            line=dict(color="#E5E8E8", width=1.2),
+        ),
+        customdata=grp[["pagerank_label", "n"]].to_numpy(),
         hovertemplate=f"{label}: %{{x}}<br>PageRank moyen: %{{customdata[0]}}<br>Clubs pris en compte: %{{customdata[1]}}<extra></extra>",
-        customdata=np.stack([grp["pagerank_label"], grp["n"]], axis=-1),
     )
 
-    # Mise en forme esthétique
+    # Mise en forme esthétique (une seule passe sur le layout)
     ymax = float(grp["pagerank_ppm"].max()) * 1.10
-    fig.update_layout(
+    return go.Figure(data=[bar], layout=dict(
         template="plotly_white",
         plot_bgcolor="#FFFFFF",
         paper_bgcolor="#FFFFFF",
         font=dict(color="#2C3E50", size=15),
-        title_x=0.5,
+        title=dict(
+            text=f"Influence totale (somme des scores PageRank) par {label} (Top 15)",
+            x=0.5,
+            font=dict(size=20, color="#1A5276", family="Lato, sans-serif"),
+        ),
         height=550,
         margin=dict(l=60, r=40, t=80, b=120),
-        xaxis_tickangle=-25,
+        xaxis=dict(title=label, tickangle=-25),
+        yaxis=dict(title="Somme du PageRank (ppm)", range=[0, ymax]),
         showlegend=False,
-        yaxis=dict(range=[0, ymax]),
         hoverlabel=dict(bgcolor="#F9FAFB", font_size=13, font_color="#1A5276"),
-    )
-    fig.update_layout(title_font=dict(size=20, color="#1A5276", family="Lato, sans-serif"))
+    ))
 
-    return fig
+
+def _figure_json(fig):
+    """Figure (go.Figure ou dict au schéma Plotly) déjà sérialisée, tableaux encodés
+    une fois pour toutes : Dash n'a plus qu'à réémettre un dict de types simples."""
+    import plotly.io as pio
+    return json.loads(pio.to_json(fig, validate=False))
+
+
+@lru_cache(maxsize=8)
+def compare_figure(dim="country", is_dark=False):
+    """Figure Ligue / Pays mémorisée par (dim, is_dark), sous forme de dict pré-sérialisé."""
+    return _figure_json(build_compare_figures(dim=dim, is_dark=is_dark))
 
 # Figures initiales (pour éviter les graphes vides)
-_initial_box = build_compare_figures(dim="country", is_dark=bool(app._force_default_theme_dark))
+_initial_box = compare_figure(dim="country", is_dark=bool(app._force_default_theme_dark))
+
+# Histogramme de distribution des scores (callback principal et aperçu statique)
+def build_distribution_figure(subset, is_dark=False):
+    import plotly.express as px
+    dist_color = [DIST_COLORS[bool(is_dark)]]
+    fig_dist = px.histogram(
+        subset,
+        x="pagerank",
+        nbins=10,
+        title="Distribution des scores PageRank",
+        color_discrete_sequence=dist_color
+    )
+    fig_dist.update_layout(**BASE_LAYOUT, height=450, margin=MARGIN_COMPACT, hoverlabel=HOVERLABEL)
+    fig_dist.update_traces(
+        marker_line_width=0,
+        hoverlabel=HOVERLABEL,
+        hovertemplate="Score: %{x:.4f} | Fréquence: %{y}<extra></extra>"
+    )
+    return fig_dist
+
+
+# Kaleido optionnel : aperçu PNG de la distribution pour le premier affichage
+KALEIDO_AVAILABLE = importlib.util.find_spec("kaleido") is not None
+DIST_PREVIEW_PATH = ASSETS_DIR / "distribution_init.png"
+
+
+def _distribution_preview():
+    """Figure initiale du graphe de distribution : l'histogramme de la vue par défaut
+    pré-rendu en PNG (aucune trace à instancier côté navigateur), affiché jusqu'à la
+    réponse du callback. Le PNG n'est régénéré que si les données sont plus récentes ;
+    renvoie None sans kaleido ou en cas d'échec du rendu.
+    """
+    if not KALEIDO_AVAILABLE or df.empty:
+        return None
+    try:
+        if not DIST_PREVIEW_PATH.exists() or DIST_PREVIEW_PATH.stat().st_mtime < DATA_PATH.stat().st_mtime:
+            subset = df.head(min(15, len(df)))
+            fig = build_distribution_figure(subset, bool(app._force_default_theme_dark))
+            fig.write_image(str(DIST_PREVIEW_PATH), width=900, height=450)
+    except Exception as e:
+        logging.warning(f"Aperçu de la distribution non généré : {e}")
+        return None
+    return {
+        "data": [],
+        "layout": {
+            "images": [{
+                "source": app.get_asset_url(DIST_PREVIEW_PATH.name),
+                "xref": "paper", "yref": "paper", "x": 0, "y": 1,
+                "sizex": 1, "sizey": 1, "xanchor": "left", "yanchor": "top",
+                "sizing": "stretch", "layer": "below",
+            }],
+            "xaxis": {"visible": False},
+            "yaxis": {"visible": False},
+            "height": 450,
+            "margin": {"l": 0, "r": 0, "t": 0, "b": 0},
+            "plot_bgcolor": "#FFFFFF",
+            "paper_bgcolor": "#FFFFFF",
+        },
+    }
+
+
+_initial_dist = _distribution_preview()
+
+# Contenu statique de l'onglet « Contexte & Interprétation » : (titre, paragraphe)
+CONTEXT_SECTIONS = [
+    ("Objectif du projet",
+     "Ce projet applique l’algorithme PageRank au réseau du football européen afin d’identifier les clubs les plus influents dans un graphe de matchs. "
+     "L’objectif est de démontrer comment une approche issue du web mining peut être utilisée dans un contexte sportif."),
+    ("Principe du PageRank",
+     "L’algorithme PageRank attribue à chaque club un score d’influence basé sur les victoires et la qualité des adversaires battus. "
+     "Battre un club très influent augmente davantage le score qu’une victoire contre un club peu connecté."),
+    ("Construction du graphe",
+     "Chaque club est représenté par un nœud, et chaque match correspond à une arête orientée du perdant vers le gagnant. "
+     "Les données proviennent du jeu de données European Soccer Database (Kaggle)."),
+    ("Interprétation des résultats",
+     "Les scores PageRank ne représentent pas un classement sportif réel. Ils traduisent la position structurelle des clubs dans le graphe. "
+     "Ainsi, certains clubs modestes peuvent apparaître en tête si leur réseau de matchs est plus dense ou mieux connecté."),
+    ("Intérêt scientifique et pédagogique",
+     "Le projet illustre la puissance des algorithmes de graphes pour modéliser la connectivité dans des systèmes complexes. "
+     "Il montre comment des concepts de data science peuvent s’appliquer à des domaines variés comme le sport."),
+]
+
+
+def context_sections():
+    """Titres et paragraphes de l'onglet Contexte, mis en forme par les classes ctx-*
+    de assets/custom.css (la première section n'a pas de marge haute)."""
+    children = []
+    for i, (title, text) in enumerate(CONTEXT_SECTIONS):
+        children += [
+            html.H4(title, className="ctx-h4" if i else "ctx-h4 ctx-h4-first"),
+            html.P(text, className="ctx-p"),
+        ]
+    return children
+
+
+def page_footer():
+    """Pied de page commun aux onglets."""
+    return html.Footer(
+        [
+            html.Hr(),
+            html.P("Projet universitaire - Master BIDABI | Visualisation et Analyse de Données Réelles", className="text-center text-muted mt-2"),
+            html.P("© 2025 - Tableau de bord Football PageRank | Réalisé par Mevlut Cakin",
+                   className="text-center text-body"),
+            html.P("Source : Données Kaggle - Football Graph Network", className="text-center text-muted mb-2"),
+        ],
+        style={"backgroundColor": "#F9FAFB", "padding": "10px", "borderRadius": "6px"}
+    )
+
 
 #  Layout principal 
 app.layout = html.Div([
@@ -433,10 +772,8 @@ app.layout = html.Div([
                         ),
 
                         dbc.Row([
-                            dbc.Col(kpi_card("Nombre total d’équipes", f"{total_teams:,}", "info", ""), md=3),
-                            dbc.Col(kpi_card("Meilleur club (PageRank max)", top_team, "success", ""), md=3),
-                            dbc.Col(kpi_card("Score moyen de PageRank", f"{avg_rank:.6f}", "warning", ""), md=3),
-                            dbc.Col(kpi_card("Pays le plus représenté", most_common_country, "primary", ""), md=3),
+                            dbc.Col(kpi_card(title, value, color, ""), md=3)
+                            for title, value, color in KPI_CARDS
                         ], className="text-center mt-2 mb-4 fade-in"),
 
                         html.Hr(style={"borderColor": "#4B8BBE"}),
@@ -470,6 +807,8 @@ app.layout = html.Div([
                                     marks={i: f"Top {i}" for i in range(5, min(31, len(df)+1), 5)},
                                     tooltip={"placement": "bottom"}
                                 ),
+                                # Valeur du slider après temporisation : seule entrée du graphique principal
+                                dcc.Store(id="top-n-debounced", data=min(15, len(df))),
                                 html.Div(
                                     [
                                         html.Span("Ordre de tri : ", className="text-body me-2 fw-bold"),
@@ -509,7 +848,16 @@ app.layout = html.Div([
                                 dbc.Row([
                                     dbc.Col([
                                         html.H4("Analyse de la distribution des scores PageRank", className="text-primary mt-4 mb-3"),
-                                        dcc.Loading(type="circle", children=dcc.Graph(id="distribution-graph", style={"height": "450px"}))
+                                        dcc.Loading(
+                                            type="circle",
+                                            # L'aperçu PNG reste visible pendant le premier calcul
+                                            **({"overlay_style": {"visibility": "visible", "opacity": 0.6}} if _initial_dist else {}),
+                                            children=dcc.Graph(
+                                                id="distribution-graph",
+                                                style={"height": "450px"},
+                                                **({"figure": _initial_dist} if _initial_dist else {}),
+                                            ),
+                                        )
                                     ], md=8),
 
                                     dbc.Col([
@@ -553,8 +901,8 @@ app.layout = html.Div([
                                     dbc.Col([
                                         dcc.Dropdown(
                                             id="club-selector",
-                                            options=[{"label": club, "value": club} for club in sorted(df_yearly["team"].unique())],
-                                            value=sorted(df_yearly["team"].unique())[0] if not df_yearly.empty else None,
+                                            options=YEARLY_OPTIONS,
+                                            value=YEARLY_TEAMS[0] if YEARLY_TEAMS else None,
                                             placeholder="Sélectionner un club",
                                             clearable=False,
                                             className="mb-3"
@@ -571,16 +919,7 @@ app.layout = html.Div([
                         if not df_yearly.empty else None
                         ),
 
-                        html.Footer(
-                            [
-                                html.Hr(),
-                                html.P("Projet universitaire - Master BIDABI | Visualisation et Analyse de Données Réelles", className="text-center text-muted mt-2"),
-                                html.P("© 2025 - Tableau de bord Football PageRank | Réalisé par Mevlut Cakin",
-                                       className="text-center text-body"),
-                                html.P("Source : Données Kaggle - Football Graph Network", className="text-center text-muted mb-2"),
-                            ],
-                            style={"backgroundColor": "#F9FAFB", "padding": "10px", "borderRadius": "6px"}
-                        )
+                        page_footer()
                     ]
                 ),
                 dcc.Tab(
@@ -593,16 +932,7 @@ app.layout = html.Div([
                             dcc.Loading(type="circle",
                                         children=dcc.Graph(id="compare-boxplot", figure=_initial_box, style={"height": "500px"})),
                         ], className="mb-5 fade-in", style={"backgroundColor": "#FAFAFA", "padding": "20px", "borderRadius": "10px"}),
-                        html.Footer(
-                            [
-                                html.Hr(),
-                                html.P("Projet universitaire - Master BIDABI | Visualisation et Analyse de Données Réelles", className="text-center text-muted mt-2"),
-                                html.P("© 2025 - Tableau de bord Football PageRank | Réalisé par Mevlut Cakin",
-                                       className="text-center text-body"),
-                                html.P("Source : Données Kaggle - Football Graph Network", className="text-center text-muted mb-2"),
-                            ],
-                            style={"backgroundColor": "#F9FAFB", "padding": "10px", "borderRadius": "6px"}
-                        )
+                        page_footer()
                     ]
                 ),
                 dcc.Tab(
@@ -621,88 +951,23 @@ app.layout = html.Div([
                                 }),
                             ], style={"textAlign": "center", "marginBottom": "28px"}),
                             html.Div([
-                                html.H4("Objectif du projet", style={
-                                    "color": "#1A5276",
-                                    "fontWeight": "bold",
-                                    "marginBottom": "10px"
-                                }),
-                                html.P(
-                                    "Ce projet applique l’algorithme PageRank au réseau du football européen afin d’identifier les clubs les plus influents dans un graphe de matchs. "
-                                    "L’objectif est de démontrer comment une approche issue du web mining peut être utilisée dans un contexte sportif.",
-                                    style={"color": "#222", "fontSize": "16px", "marginBottom": "22px", "marginTop": "2px", "lineHeight": "1.7"}
-                                ),
-                                html.H4("Principe du PageRank", style={
-                                    "color": "#1A5276",
-                                    "fontWeight": "bold",
-                                    "marginTop": "20px",
-                                    "marginBottom": "10px"
-                                }),
-                                html.P(
-                                    "L’algorithme PageRank attribue à chaque club un score d’influence basé sur les victoires et la qualité des adversaires battus. "
-                                    "Battre un club très influent augmente davantage le score qu’une victoire contre un club peu connecté.",
-                                    style={"color": "#222", "fontSize": "16px", "marginBottom": "22px", "marginTop": "2px", "lineHeight": "1.7"}
-                                ),
-                                html.H4("Construction du graphe", style={
-                                    "color": "#1A5276",
-                                    "fontWeight": "bold",
-                                    "marginTop": "20px",
-                                    "marginBottom": "10px"
-                                }),
-                                html.P(
-                                    "Chaque club est représenté par un nœud, et chaque match correspond à une arête orientée du perdant vers le gagnant. "
-                                    "Les données proviennent du jeu de données European Soccer Database (Kaggle).",
-                                    style={"color": "#222", "fontSize": "16px", "marginBottom": "22px", "marginTop": "2px", "lineHeight": "1.7"}
-                                ),
-                                html.H4("Interprétation des résultats", style={
-                                    "color": "#1A5276",
-                                    "fontWeight": "bold",
-                                    "marginTop": "20px",
-                                    "marginBottom": "10px"
-                                }),
-                                html.P(
-                                    "Les scores PageRank ne représentent pas un classement sportif réel. Ils traduisent la position structurelle des clubs dans le graphe. "
-                                    "Ainsi, certains clubs modestes peuvent apparaître en tête si leur réseau de matchs est plus dense ou mieux connecté.",
-                                    style={"color": "#222", "fontSize": "16px", "marginBottom": "22px", "marginTop": "2px", "lineHeight": "1.7"}
-                                ),
-                                html.H4("Intérêt scientifique et pédagogique", style={
-                                    "color": "#1A5276",
-                                    "fontWeight": "bold",
-                                    "marginTop": "20px",
-                                    "marginBottom": "10px"
-                                }),
-                                html.P(
-                                    "Le projet illustre la puissance des algorithmes de graphes pour modéliser la connectivité dans des systèmes complexes. "
-                                    "Il montre comment des concepts de data science peuvent s’appliquer à des domaines variés comme le sport.",
-                                    style={"color": "#222", "fontSize": "16px", "marginBottom": "22px", "marginTop": "2px", "lineHeight": "1.7"}
-                                ),
-                                html.H4("Perspectives d’amélioration", style={
-                                    "color": "#1A5276",
-                                    "fontWeight": "bold",
-                                    "marginTop": "20px",
-                                    "marginBottom": "10px"
-                                }),
+                                *context_sections(),
+                                html.H4("Perspectives d’amélioration", className="ctx-h4"),
                                 html.Ul([
-                                    html.Li("Pondérer les matchs selon la différence de buts.", style={"color": "#222", "fontSize": "16px", "marginBottom": "7px"}),
-                                    html.Li("Prendre en compte la saison ou la compétition.", style={"color": "#222", "fontSize": "16px", "marginBottom": "7px"}),
-                                    html.Li("Ajouter un indicateur temporel d’évolution du PageRank.", style={"color": "#222", "fontSize": "16px", "marginBottom": "7px"}),
-                                    html.Li("Enrichir le modèle avec d’autres ligues ou pays.", style={"color": "#222", "fontSize": "16px"}),
-                                ], style={"marginLeft": "15px", "marginBottom": "22px", "marginTop": "2px", "lineHeight": "1.7"})
+                                    html.Li("Pondérer les matchs selon la différence de buts.", className="ctx-li"),
+                                    html.Li("Prendre en compte la saison ou la compétition.", className="ctx-li"),
+                                    html.Li("Ajouter un indicateur temporel d’évolution du PageRank.", className="ctx-li"),
+                                    html.Li("Enrichir le modèle avec d’autres ligues ou pays.", className="ctx-li"),
+                                ], className="ctx-ul")
                             ], style={"maxWidth": "800px", "margin": "0 auto", "padding": "32px 28px 18px 28px", "background": "#FFFFFF", "borderRadius": "12px", "boxShadow": "0 4px 12px rgba(0,0,0,0.07)", "marginBottom": "28px"}),
                             html.Div([
-                                html.H4("Synthèse finale", style={
-                                    "color": "#1A5276",
-                                    "fontWeight": "bold",
-                                    "marginTop": "20px",
-                                    "marginBottom": "10px",
-                                    "borderBottom": "2px solid #D5DBDB",
-                                    "paddingBottom": "4px"
-                                }),
+                                html.H4("Synthèse finale", className="ctx-h4 ctx-h4-underline"),
                                 html.P(
                                     "Ce tableau de bord illustre comment un étudiant en data science peut allier "
                                     "rigueur analytique, storytelling visuel et compréhension métier. "
                                     "Le modèle PageRank, bien qu’abstrait, démontre la puissance de la théorie des graphes "
                                     "pour révéler des structures d’influence cachées dans les données sportives.",
-                                    style={"color": "#222", "fontSize": "16px", "marginBottom": "16px", "marginTop": "2px", "lineHeight": "1.7"}
+                                    className="ctx-p", style={"marginBottom": "16px"}
                                 ),
                                 html.P(
                                     "Projet réalisé par Mevlut Cakin — Master 2 Big Data & Business Intelligence "
@@ -710,16 +975,7 @@ app.layout = html.Div([
                                     style={"fontStyle": "italic", "color": "#1A5276", "textAlign": "center", "marginTop": "15px"}
                                 )
                             ], style={"maxWidth": "800px", "margin": "0 auto", "padding": "28px 28px 12px 28px", "background": "#FAFAFA", "borderRadius": "12px", "boxShadow": "0 2px 8px rgba(0,0,0,0.04)", "marginBottom": "28px"}),
-                            html.Footer(
-                                [
-                                    html.Hr(),
-                                    html.P("Projet universitaire - Master BIDABI | Visualisation et Analyse de Données Réelles", className="text-center text-muted mt-2"),
-                                    html.P("© 2025 - Tableau de bord Football PageRank | Réalisé par Mevlut Cakin",
-                                           className="text-center text-body"),
-                                    html.P("Source : Données Kaggle - Football Graph Network", className="text-center text-muted mb-2"),
-                                ],
-                                style={"backgroundColor": "#F9FAFB", "padding": "10px", "borderRadius": "6px"}
-                            )
+                            page_footer()
                         ], style={"background": "linear-gradient(180deg, #F9F9F4 0%, #FFFFFF 100%)", "minHeight": "100vh"})
                     ]
                 ),
@@ -728,6 +984,120 @@ app.layout = html.Div([
     ], fluid=True)
 ], id='app-body', className='theme-light')
 
+# Classement figé au chargement (df déjà trié par score décroissant) :
+# noms, scores et longueurs des noms en tableaux, tranchés par le callback principal
+PR_TEAMS = df["team"].to_numpy(dtype=object)
+PR_VALUES = df["pagerank"].to_numpy()
+PR_TEAM_LEN = np.fromiter((len(t) for t in PR_TEAMS), dtype=np.int64, count=len(PR_TEAMS))
+# Plus long nom parmi les i + 1 premiers clubs affichés, pour chaque ordre de tri
+# (maximum cumulé) : la marge gauche se lit directement à l'index top_n - 1
+PR_LABEL_CUMMAX = {
+    "desc": np.maximum.accumulate(PR_TEAM_LEN),
+    "asc": np.maximum.accumulate(PR_TEAM_LEN[::-1]),
+}
+# Score par club pour le texte de sélection (parcours inversé : un nom présent
+# plusieurs fois garde son meilleur score, le premier du classement)
+TEAM_TO_PR = dict(zip(PR_TEAMS[::-1], PR_VALUES[::-1]))
+
+# Exécuteur partagé : construction concurrente des figures du callback principal
+FIGURE_EXECUTOR = ThreadPoolExecutor(max_workers=3, thread_name_prefix="figures")
+
+
+@lru_cache(maxsize=None)
+def _plotly_white_template():
+    """Template plotly_white déplié une fois en dict (comme l'émet plotly.express)."""
+    import plotly.io as pio
+    return json.loads(pio.json.to_json_plotly(pio.templates["plotly_white"].to_plotly_json()))
+
+
+def build_main_figure(subset, top_n, category_order, left_margin, xmax):
+    """Barres horizontales du Top N (graphique principal), écrites directement au
+    schéma Plotly : ni plotly.express ni validation des propriétés. Même figure que
+    px.bar(orientation="h", text_auto=".4f") sous le thème clair forcé."""
+    bar = {
+        "type": "bar",
+        "orientation": "h",
+        # Tableau typé plotly.js (float32 encodé en base64), comme à la sérialisation d'une go.Figure
+        "x": {"dtype": "f4", "bdata": base64.b64encode(np.asarray(subset["pagerank"], dtype=np.float32).tobytes()).decode("ascii")},
+        "y": list(subset["team"]),
+        "xaxis": "x",
+        "yaxis": "y",
+        "name": "",
+        "legendgroup": "",
+        "showlegend": False,
+        # Valeurs à l'extérieur des barres, sans coupe
+        "texttemplate": "%{x:.4f}",
+        "textposition": "outside",
+        "cliponaxis": False,
+        "marker": {"color": PASTEL_TOP15[0], "pattern": {"shape": ""}, "line": {"width": 0, "color": "#FFFFFF"}},
+        "hoverlabel": HOVERLABEL,
+        "hovertemplate": "<b>%{y}</b><br>Score: %{x:.4f}<extra></extra>",
+    }
+    layout = {
+        "template": _plotly_white_template(),
+        # Espace à droite pour les étiquettes extérieures
+        "xaxis": {"anchor": "y", "domain": [0.0, 1.0], "title": {"text": "Score PageRank"}, "range": [0, xmax]},
+        # Ticks décalés à gauche (marge automatique)
+        "yaxis": {"anchor": "x", "domain": [0.0, 1.0], "title": {"text": "Club"},
+                  "automargin": True, "categoryorder": category_order},
+        "legend": {"tracegroupgap": 0},
+        "barmode": "relative",
+        "title": {
+            "text": f"Top {top_n} clubs européens par PageRank (avec ligue et pays)",
+            "font": TITLE_FONT,
+            "x": 0.5,
+        },
+        "font": BASE_FONT,
+        "transition": {"duration": 700, "easing": "cubic-in-out"},
+        "margin": {"l": left_margin, "r": 60, "t": 80, "b": 60},
+        "hoverlabel": HOVERLABEL,
+        "plot_bgcolor": "#FFFFFF",
+        "paper_bgcolor": "#FFFFFF",
+        "height": 650,
+        "bargap": 0.25,
+    }
+    return {"data": [bar], "layout": layout}
+
+
+def build_pie_figure(top3_sum, rest_sum, pct_top3, is_dark=False):
+    """Camembert Top 3 / Reste."""
+    import plotly.express as px
+    fig_pie = px.pie(
+        names=["Top 3", "Reste"],
+        values=[top3_sum, rest_sum],
+        hole=0.55,
+        color=["Top 3", "Reste"],
+        color_discrete_map=dict(zip(["Top 3", "Reste"], PIE_COLORS[bool(is_dark)])),
+        title=f"Part d’influence du Top 3 : {pct_top3:.1f}%"
+    )
+    fig_pie.update_layout(**BASE_LAYOUT, height=420, margin=MARGIN_COMPACT)
+    fig_pie.update_traces(marker_line_width=0, hoverlabel=HOVERLABEL)
+    return fig_pie
+
+
+#  Temporisation du slider Top N côté navigateur 
+# Le slider n'émet qu'au relâchement de la souris, mais les flèches du clavier et
+# les clics successifs sur les graduations déclenchent chacun le callback complet
+# (trois figures) : seule la dernière valeur stable depuis 300 ms est transmise,
+# les promesses précédentes étant résolues sans mise à jour.
+app.clientside_callback(
+    """
+    function(value) {
+        const d = window._topNDebounce = window._topNDebounce || {};
+        clearTimeout(d.timer);
+        if (d.resolve) { d.resolve(window.dash_clientside.no_update); }
+        return new Promise(function(resolve) {
+            d.resolve = resolve;
+            d.timer = setTimeout(function() { d.resolve = null; resolve(value); }, 300);
+        });
+    }
+    """,
+    Output("top-n-debounced", "data"),
+    Input("top-n-slider", "value"),
+    prevent_initial_call=True,
+)
+
+
 #  Callback principal 
 @app.callback(
     Output("pagerank-graph", "figure"),
@@ -739,147 +1109,82 @@ app.layout = html.Div([
     Output("shannon-index", "children"),
     Output("story-box", "children"),
     Output("selection-info", "children"),
-    Input("top-n-slider", "value"),
+    Input("top-n-debounced", "data"),
     Input("theme-switch", "value"),
     Input("sort-order", "value"),
     Input("pagerank-graph", "clickData"),
 )
 def update_graph(top_n, is_dark, sort_order, click_data):
+    # Bascule de thème seule : mise à jour partielle des deux couleurs concernées
+    if ctx.triggered_id == "theme-switch" and not df.empty:
+        return theme_patches(bool(is_dark))
+    #  Récupération de l'équipe sélectionnée
+    selected_team = None
+    if click_data and "points" in click_data and click_data["points"]:
+        selected_team = click_data["points"][0].get("y")
+    return graph_outputs(top_n, bool(is_dark), sort_order, selected_team)
+
+
+def theme_patches(is_dark):
+    """Sorties du callback principal pour un simple changement de thème : Patch des
+    couleurs de l'histogramme et du camembert, le reste inchangé (no_update)."""
+    dist = Patch()
+    dist["data"][0]["marker"]["color"] = DIST_COLORS[is_dark]
+    pie = Patch()
+    pie["data"][0]["marker"]["colors"] = list(PIE_COLORS[is_dark])
+    keep = dash.no_update
+    return keep, dist, keep, keep, pie, keep, keep, keep, keep
+
+
+@lru_cache(maxsize=256)
+def graph_outputs(top_n, is_dark, sort_order, selected_team):
+    """Sorties du callback principal mémorisées par (top_n, is_dark, sort_order, club sélectionné),
+    figures pré-sérialisées."""
+    outputs = list(_build_graph_outputs(top_n, is_dark, sort_order, selected_team))
+    for i in (0, 1, 4):
+        outputs[i] = _figure_json(outputs[i])
+    return tuple(outputs)
+
+
+def _build_graph_outputs(top_n, is_dark, sort_order, selected_team):
+    import plotly.express as px
     if df.empty or top_n is None or top_n <= 0:
         empty_fig = px.bar(title="Aucune donnée à afficher.")
         return empty_fig, empty_fig, "N/A", "Pas de données à analyser.", empty_fig, "", "N/A", "", "Aucune sélection"
 
+    # Tranches des tableaux triés (vues NumPy, pas de DataFrame intermédiaire)
+    n = int(top_n)
     if sort_order == "desc":
-        subset = df.head(int(top_n))
+        sl = slice(None, n)
         category_order = "total ascending"
     else:
-        subset = df.tail(int(top_n)).sort_values("pagerank", ascending=True)
+        sl = slice(-1, -n - 1, -1) if n < len(PR_VALUES) else slice(None, None, -1)
         category_order = "total descending"
+    teams, values = PR_TEAMS[sl], PR_VALUES[sl]
+    subset = {"team": teams, "pagerank": values}
 
-    #  Récupération de l'équipe sélectionnée
-    selected_team = None
-    if click_data and "points" in click_data and click_data["points"]:
-        selected_team = click_data["points"][0].get("y")
-
-    selection_text = "Aucune sélection" if not selected_team else f"{selected_team} — score PageRank : {float(subset.loc[subset['team']==selected_team, 'pagerank'].values[0]):.6f}"
+    selection_text = "Aucune sélection" if not selected_team else f"{selected_team} — score PageRank : {float(TEAM_TO_PR[selected_team]):.6f}"
 
     #  Marges et plage pour éviter que les noms touchent les barres
-    max_label_len = int(subset["team"].str.len().max()) if not subset.empty else 10
+    max_label_len = int(PR_LABEL_CUMMAX["desc" if sort_order == "desc" else "asc"][len(teams) - 1]) if len(teams) else 10
     left_margin = min(320, max(120, max_label_len * 7))  # largeur en px selon la longueur des noms
-    xmax = float(subset["pagerank"].max()) * 1.12 if not subset.empty else 1.0
-
-    # Theme settings
-    template = "plotly_dark" if is_dark else "plotly_white"
-    bg = "#0B1320" if is_dark else "#F9FAFB"
-    font_color = "#ECF0F1" if is_dark else "#2C3E50"
-    dist_color = ["#F4D03F"] if is_dark else ["#2ECC71"]
-    bar_scale = px.colors.sequential.Magma if is_dark else px.colors.sequential.Tealgrn
-
-    #  Graphique principal (barres horizontales)
-    fig_main = px.bar(
-        subset,
-        y="team",
-        x="pagerank",
-        orientation="h",
-        title=f"Top {top_n} clubs européens par PageRank (avec ligue et pays)",
-        labels={"team": "Club", "pagerank": "Score PageRank"},
-        text_auto=".4f",
-        color_discrete_sequence=px.colors.qualitative.Pastel2
-    )
-    # Place les valeurs à l'extérieur des barres et évite les coupes
-    fig_main.update_traces(
-        textposition="outside", cliponaxis=False,
-        marker_line_width=0,
-        hoverlabel=dict(bgcolor="#F9FAFB", font_size=13)
-    )
-    # Laisse de l'espace à droite pour les étiquettes extérieures
-    fig_main.update_xaxes(range=[0, xmax])
-    # Décale les ticks du côté gauche et ajoute un padding
-    fig_main.update_yaxes(automargin=True)
-    fig_main.update_layout(
-        template="plotly_white",
-        plot_bgcolor="#FFFFFF",
-        paper_bgcolor="#FFFFFF",
-        font=dict(color="#2C3E50"),
-        transition={"duration": 700, "easing": "cubic-in-out"},
-        title_x=0.5,
-        title_font=dict(size=22, color="#1A5276", family="Lato, sans-serif"),
-        height=650,
-        margin=dict(l=left_margin, r=60, t=80, b=60),
-        yaxis=dict(categoryorder=category_order),
-        hoverlabel=dict(bgcolor="#F9FAFB", font_size=13),
-        bargap=0.25,
-    )
-    fig_main.update_traces(
-        marker_line_color="#FFFFFF",
-        hovertemplate="<b>%{y}</b><br>Score: %{x:.4f}<extra></extra>"
-    )
-
-    #  Distribution des scores
-    fig_dist = px.histogram(
-        subset,
-        x="pagerank",
-        nbins=10,
-        title="Distribution des scores PageRank",
-        color_discrete_sequence=dist_color
-    )
-    fig_dist.update_layout(
-        template="plotly_white",
-        plot_bgcolor="#FFFFFF",
-        paper_bgcolor="#FFFFFF",
-        font=dict(color="#2C3E50"),
-        title_x=0.5,
-        title_font=dict(size=22, color="#1A5276", family="Lato, sans-serif"),
-        height=450,
-        margin=dict(l=40, r=40, t=60, b=40),
-        hoverlabel=dict(bgcolor="#F9FAFB", font_size=13),
-    )
-    fig_dist.update_traces(
-        marker_line_width=0,
-        hoverlabel=dict(bgcolor="#F9FAFB", font_size=13),
-        hovertemplate="Score: %{x:.4f} | Fréquence: %{y}<extra></extra>"
-    )
+    xmax = float(values.max()) * 1.12 if len(values) else 1.0
 
     #  Calculs analytiques
-    std_dev = float(np.std(subset["pagerank"]))
-    avg_val = float(np.mean(subset["pagerank"]))
+    # Moyenne, écart-type, somme, diversité de Shannon (scores normalisés) et
+    # somme des trois premiers de la tranche affichée, en un seul appel
+    avg_val, std_dev, total_sum, shannon, top3_sum = (float(v) for v in _score_stats(values))
     index_val = round(std_dev / avg_val * 100, 2) if avg_val != 0 else 0
 
-    # Shannon diversity on normalized scores
-    probs = (subset["pagerank"] / subset["pagerank"].sum()).clip(lower=1e-12)
-    shannon = float(-(probs * np.log(probs)).sum())
-
     # Top 3 vs Reste
-    top3_sum = float(subset.head(3)["pagerank"].sum())
-    total_sum = float(subset["pagerank"].sum())
     rest_sum = max(total_sum - top3_sum, 0.0)
     pct_top3 = 100 * top3_sum / total_sum if total_sum else 0
 
-    fig_pie = px.pie(
-        names=["Top 3", "Reste"],
-        values=[top3_sum, rest_sum],
-        hole=0.55,
-        color=["Top 3", "Reste"],
-        color_discrete_map={
-            "Top 3": ("#F39C12" if is_dark else "#1ABC9C"),
-            "Reste": ("#5D6D7E" if is_dark else "#95A5A6")
-        },
-        title=f"Part d’influence du Top 3 : {pct_top3:.1f}%"
-    )
-    fig_pie.update_layout(
-        template="plotly_white",
-        plot_bgcolor="#FFFFFF",
-        paper_bgcolor="#FFFFFF",
-        font=dict(color="#2C3E50"),
-        title_x=0.5,
-        title_font=dict(size=22, color="#1A5276", family="Lato, sans-serif"),
-        height=420,
-        margin=dict(l=40, r=40, t=60, b=40)
-    )
-    fig_pie.update_traces(
-        marker_line_width=0,
-        hoverlabel=dict(bgcolor="#F9FAFB", font_size=13)
-    )
+    # Les trois figures sont construites en parallèle
+    fut_main = FIGURE_EXECUTOR.submit(build_main_figure, subset, top_n, category_order, left_margin, xmax)
+    fut_dist = FIGURE_EXECUTOR.submit(build_distribution_figure, subset, is_dark)
+    fut_pie = FIGURE_EXECUTOR.submit(build_pie_figure, top3_sum, rest_sum, pct_top3, is_dark)
+    fig_main, fig_dist, fig_pie = fut_main.result(), fut_dist.result(), fut_pie.result()
 
     # Insights textuels
     if index_val < 5:
@@ -902,18 +1207,15 @@ def update_graph(top_n, is_dark, sort_order, click_data):
         f"Indice de Shannon : {shannon:.2f} ({shannon_comment})."
     )
     # Storytelling enrichi
-    ranked = subset.sort_values('pagerank', ascending=False).reset_index(drop=True)
-    leader = ranked.iloc[0]['team']
-    leader_score = ranked.iloc[0]['pagerank']
-    trailer = ranked.iloc[-1]['team']
-    trailer_score = ranked.iloc[-1]['pagerank']
+    # Tranche dans l'ordre décroissant : leader en tête, dernier en queue
+    first, last = (0, -1) if sort_order == "desc" else (-1, 0)
+    leader, leader_score = teams[first], values[first]
+    trailer, trailer_score = teams[last], values[last]
     story = (
         f"Top {top_n} — Leader : {leader} ({leader_score:.4f}). "
         f"Dernier de l’échantillon : {trailer} ({trailer_score:.4f}). "
         f"Part Top 3 : {pct_top3:.1f}%. {shannon_comment.capitalize()} (Shannon {shannon:.2f})."
     )
-    fig_main.update_traces(textposition="outside", cliponaxis=False)
-    fig_main.update_layout(margin=dict(l=left_margin, r=60, t=80, b=60))
 
     return (
         fig_main,
@@ -954,21 +1256,55 @@ def download_csv(n_clicks, top_n, sort_order):
 def download_summary_cb(n_clicks):
     if not n_clicks:
         return dash.no_update
+    return _summary_download(datetime.now().strftime('%Y-%m-%d %H:%M'))
+
+
+@lru_cache(maxsize=4)
+def _summary_download(generated_at):
+    """Réponse de téléchargement (octets déjà encodés en base64) mémorisée par minute."""
     try:
-        data = build_summary_pdf_bytes()
+        data = _summary_pdf_bytes(generated_at)
         filename = 'resume_pagerank.pdf'
     except Exception:
-        data = build_summary_txt_bytes()
+        data = _summary_txt_bytes(generated_at)
         filename = 'resume_pagerank.txt'
-    # Dash expects a writer function for send_bytes
-    return dcc.send_bytes(lambda b: b.write(data), filename)
+    # Les octets déjà construits sont envoyés tels quels (pas de writer intermédiaire)
+    return dcc.send_bytes(data, filename)
 
-#  Persistance simple du thème 
-@app.callback(Output("theme-store", "data"), Input("theme-switch", "value"))
-def persist_theme(is_dark):
-    return "dark" if is_dark else "light"
+#  Persistance simple du thème (côté navigateur, sans aller-retour serveur)
+app.clientside_callback(
+    "function(isDark) { return isDark ? 'dark' : 'light'; }",
+    Output("theme-store", "data"),
+    Input("theme-switch", "value"),
+)
 
 
+#  Sous-échantillonnage côté serveur de la courbe d'évolution (LTTB) 
+EVOLUTION_MAX_POINTS = 500
+
+def _lttb_indices(y, n_out):
+    """Indices conservés par Largest-Triangle-Three-Buckets sur une série à pas régulier.
+    Garde le premier et le dernier point, puis, dans chaque seau, le point formant
+    le plus grand triangle avec le point retenu précédent et la moyenne du seau suivant.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.arange(n, dtype=float)
+    y = np.asarray(y, dtype=float)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0], idx[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        nxt_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x, avg_y = x[end:nxt_end].mean(), y[end:nxt_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(area.argmax())
+        idx[i + 1] = a
+    return idx
+
 #  Callback évolution PageRank par club 
 @app.callback(
     Output("evolution-graph", "figure"),
@@ -976,47 +1312,56 @@ def persist_theme(is_dark):
     Input("theme-switch", "value")
 )
 def update_evolution_graph(selected_club, is_dark):
+    return evolution_figure(selected_club, bool(is_dark))
+
+
+@lru_cache(maxsize=256)
+def evolution_figure(selected_club, is_dark=False):
+    """Figure d'évolution mémorisée par (club, is_dark), sous forme de dict pré-sérialisé."""
+    return _figure_json(_build_evolution_figure(selected_club, is_dark))
+
+
+def _build_evolution_figure(selected_club, is_dark):
     import plotly.express as px
     if not selected_club or df_yearly.empty:
         return px.line(title="Aucune donnée à afficher.")
-    dff = df_yearly[df_yearly["team"] == selected_club].sort_values("season")
-    if dff.empty:
+    if selected_club not in YEARLY_BY_TEAM:
         return px.line(title="Aucune donnée à afficher pour ce club.")
+    # Tableaux du club tels que préparés au chargement, sans DataFrame intermédiaire
+    seasons, scores = YEARLY_BY_TEAM[selected_club]
+    # Seuls EVOLUTION_MAX_POINTS points au plus sont envoyés au navigateur
+    if len(scores) > EVOLUTION_MAX_POINTS:
+        keep = _lttb_indices(scores, EVOLUTION_MAX_POINTS)
+        seasons, scores = seasons[keep], scores[keep]
     # Determine theme
     template = "plotly_dark" if is_dark else "plotly_white"
     bg = "#0B1320" if is_dark else "#F9FAFB"
     font_color = "#ECF0F1" if is_dark else "#2C3E50"
     fig = px.line(
-        dff,
-        x="season",
-        y="pagerank",
+        x=seasons,
+        y=scores,
         markers=True,
         title=f"Évolution du PageRank pour {selected_club}",
-        labels={"season": "Saison", "pagerank": "Score PageRank"}
+        labels={"x": "Saison", "y": "Score PageRank"},
+        render_mode="webgl",
     )
     fig.update_traces(
         line=dict(width=3),
         marker=dict(size=8),
         marker_line_width=0,
-        hoverlabel=dict(bgcolor="#F9FAFB", font_size=13),
+        hoverlabel=HOVERLABEL,
         hovertemplate="Saison: %{x}<br>PageRank: %{y:.4f}<extra></extra>"
     )
-    fig.update_layout(
-        template="plotly_white",
-        plot_bgcolor="#FFFFFF",
-        paper_bgcolor="#FFFFFF",
-        font=dict(color="#2C3E50"),
-        title_x=0.5,
-        title_font=dict(size=22, color="#1A5276", family="Lato, sans-serif"),
-        height=400,
-        margin=dict(l=60, r=40, t=60, b=60)
-    )
+    fig.update_layout(**BASE_LAYOUT, height=400, margin=dict(l=60, r=40, t=60, b=60))
     return fig
 
 # Lancement
 if __name__ == "__main__":
     logging.info("Dashboard prêt. Ouverture du navigateur…")
+    import webbrowser
     webbrowser.open_new("http://127.0.0.1:8060")
+    # Noyau Numba préparé pendant le lancement du serveur plutôt qu'au premier callback
+    threading.Thread(target=_score_stats_kernel, daemon=True).start()
     app.run(debug=True, port=8060, use_reloader=False)
 
 app.index_string = '''
@@ -1027,170 +1372,6 @@ app.index_string = '''
         <title>{%title%}</title>
         {%favicon%}
         {%css%}
-        <style>
-    body, html {
-        font-family: 'Lato', sans-serif;
-        background: linear-gradient(180deg, #F9F9F4 0%, #FFFFFF 100%);
-        color: #2C3E50;
-        margin: 0;
-        padding: 0;
-        line-height: 1.6;
-        letter-spacing: 0.2px;
-        transition: background-color 0.5s, color 0.5s;
-        min-height: 100vh;
-    }
-    h1, h2, h3, h4, h5, h6 {
-        color: #1A5276;
-        font-weight: 700;
-    }
-    /* Explications sobres : noir ou gris foncé uniquement */
-    p, li, .text-body, .text-secondary, .text-muted, .lead,
-    .card p, .alert p, footer p, .card-text, .form-text, label, small {
-        color: #171717 !important;
-        font-size: 16px;
-        line-height: 1.7;
-    }
-    /* Neutralisation des textes rouges/roses */
-    .text-danger, .text-warning, .text-rose, .text-pink, .text-error {
-        color: #171717 !important;
-    }
-    .navbar {
-        background-color: #1A5276 !important;
-        box-shadow: 0 2px 12px rgba(0,0,0,0.15);
-    }
-    .glass-card {
-        background: #FFFFFF;
-        border-left: 6px solid #117A65;
-        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.08);
-        border-radius: 10px;
-        transition: transform 0.3s, box-shadow 0.3s;
-        padding: 10px 15px;
-    }
-    .glass-card:hover {
-        transform: translateY(-3px);
-        box-shadow: 0 6px 16px rgba(0, 0, 0, 0.12);
-    }
-    .alert-info, .card {
-        background-color: #F4F9F8 !important;
-        border-left: 5px solid #1ABC9C !important;
-        color: #171717 !important;
-    }
-    footer {
-        background-color: #F9FAFB;
-        border-top: 2px solid #E5E8E8;
-        padding: 10px;
-        text-align: center;
-        font-size: 14px;
-        color: #5D6D7E;
-    }
-    a, .text-info, .btn-link {
-        color: #117A65 !important;
-        font-weight: 600;
-        text-decoration: none;
-    }
-    a:hover {
-        color: #0B5345 !important;
-        text-decoration: underline;
-    }
-    .section-title {
-        color: #1A5276;
-        font-weight: 700;
-        margin-top: 25px;
-        border-bottom: 2px solid #D5DBDB;
-        padding-bottom: 4px;
-    }
-    /* --- THEME LIGHT --- */
-    .theme-light, body.theme-light {
-        background-color: #F9F9F4 !important;
-        color: #2C3E50 !important;
-        transition: background-color 0.5s, color 0.5s;
-    }
-    .theme-light .navbar, body.theme-light .navbar {
-        background-color: #1A5276 !important;
-    }
-    .theme-light .glass-card, body.theme-light .glass-card {
-        background: #FFFFFF !important;
-        border-left: 6px solid #117A65 !important;
-        color: #222 !important;
-    }
-    .theme-light .alert-info, .theme-light .card, body.theme-light .alert-info, body.theme-light .card {
-        background-color: #F4F9F8 !important;
-        border-left: 5px solid #1ABC9C !important;
-        color: #171717 !important;
-    }
-    .theme-light footer, body.theme-light footer {
-        background-color: #F9FAFB !important;
-        color: #5D6D7E !important;
-    }
-    .theme-light a, .theme-light .text-info, .theme-light .btn-link,
-    body.theme-light a, body.theme-light .text-info, body.theme-light .btn-link {
-        color: #117A65 !important;
-    }
-    /* --- THEME DARK --- */
-    .theme-dark, body.theme-dark {
-        background-color: #0E1117 !important;
-        color: #ECF0F1 !important;
-        transition: background-color 0.5s, color 0.5s;
-    }
-    .theme-dark .navbar, body.theme-dark .navbar {
-        background-color: #121A24 !important;
-    }
-    .theme-dark .glass-card, body.theme-dark .glass-card {
-        background: #1C2833 !important;
-        border-left: 6px solid #1ABC9C !important;
-        color: #ECF0F1 !important;
-    }
-    .theme-dark .alert-info, .theme-dark .card, body.theme-dark .alert-info, body.theme-dark .card {
-        background-color: #1A1F25 !important;
-        border-left: 5px solid #1ABC9C !important;
-        color: #ECF0F1 !important;
-    }
-    .theme-dark footer, body.theme-dark footer {
-        background-color: #121A24 !important;
-        color: #BDC3C7 !important;
-    }
-    .theme-dark a, .theme-dark .text-info, .theme-dark .btn-link,
-    body.theme-dark a, body.theme-dark .text-info, body.theme-dark .btn-link {
-        color: #1ABC9C !important;
-    }
-    /* Adaptation des titres et paragraphes en mode sombre */
-    .theme-dark h1, .theme-dark h2, .theme-dark h3, .theme-dark h4, .theme-dark h5, .theme-dark h6,
-    body.theme-dark h1, body.theme-dark h2, body.theme-dark h3, body.theme-dark h4, body.theme-dark h5, body.theme-dark h6 {
-        color: #1ABC9C !important;
-    }
-    .theme-dark p, .theme-dark li, .theme-dark .text-body, .theme-dark .text-secondary, .theme-dark .text-muted, .theme-dark .lead,
-    .theme-dark .card p, .theme-dark .alert p, .theme-dark footer p, .theme-dark .card-text, .theme-dark .form-text, .theme-dark label, .theme-dark small,
-    body.theme-dark p, body.theme-dark li, body.theme-dark .text-body, body.theme-dark .text-secondary, body.theme-dark .text-muted, body.theme-dark .lead,
-    body.theme-dark .card p, body.theme-dark .alert p, body.theme-dark footer p, body.theme-dark .card-text, body.theme-dark .form-text, body.theme-dark label, body.theme-dark small {
-        color: #ECF0F1 !important;
-    }
-    /* Remove any residual red in dark mode */
-    .theme-dark .text-danger, .theme-dark .text-warning, .theme-dark .text-rose, .theme-dark .text-pink, .theme-dark .text-error,
-    body.theme-dark .text-danger, body.theme-dark .text-warning, body.theme-dark .text-rose, body.theme-dark .text-pink, body.theme-dark .text-error {
-        color: #ECF0F1 !important;
-    }
-    /* Paragraph/section spacing */
-    .context-section {
-        margin-bottom: 30px;
-        padding-bottom: 12px;
-    }
-    .context-section h4 {
-        margin-top: 18px;
-        margin-bottom: 8px;
-        color: #1A5276;
-        font-weight: bold;
-    }
-    .theme-dark .context-section h4,
-    body.theme-dark .context-section h4 {
-        color: #1ABC9C !important;
-    }
-    /* Responsive */
-    @media (max-width: 900px) {
-        .glass-card, .context-section {
-            padding: 12px 6px !important;
-        }
-    }
-    </style>
     </head>
     <body>
         {%app_entry%}
@@ -1208,12 +1389,11 @@ app.index_string = '''
     Input("theme-switch", "value"),
 )
 def update_compare_section(is_dark):
-    return build_compare_figures(dim="country", is_dark=is_dark)
+    return compare_figure(dim="country", is_dark=bool(is_dark))
 
-#  Callback global pour appliquer la classe thème au body 
-@app.callback(
+#  Callback global pour appliquer la classe thème au body (côté navigateur)
+app.clientside_callback(
+    "function(isDark) { return isDark ? 'theme-dark' : 'theme-light'; }",
     Output('app-body', 'className'),
     Input('theme-switch', 'value')
-)
-def update_theme(is_dark):
-    return 'theme-dark' if is_dark else 'theme-light'
\ No newline at end of file
+)
\ No newline at end of file
@@ -2,37 +2,79 @@ import sqlite3
 import pandas as pd
 from pathlib import Path
 
+# pyarrow optionnel : export Parquet en flux (un lot à la fois), sinon CSV
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except Exception:
+    PYARROW_AVAILABLE = False
+
 DB_PATH = Path(__file__).resolve().parents[1] / "data" / "database.sqlite"
-OUTPUT_PATH = Path(__file__).resolve().parents[1] / "data" / "matches_with_league.csv"
+CSV_OUTPUT_PATH = Path(__file__).resolve().parents[1] / "data" / "matches_with_league.csv"
+PARQUET_OUTPUT_PATH = CSV_OUTPUT_PATH.with_suffix(".parquet")
+# Parquet (colonnes typées, compressé) lorsque pyarrow est installé
+OUTPUT_PATH = PARQUET_OUTPUT_PATH if PYARROW_AVAILABLE else CSV_OUTPUT_PATH
+# Nombre de matchs lus puis écrits par lot (borne la mémoire à un lot)
+CHUNK_SIZE = 50_000
 
 def extract_matches():
     if not DB_PATH.exists():
         raise FileNotFoundError(f" Base introuvable : {DB_PATH}")
-    conn = sqlite3.connect(DB_PATH)
+    # Lecture seule (aucun verrou d'écriture ni journal) et pages de la base projetées
+    # en mémoire : le parcours de Match lit le cache de pages du système sans copie
+    conn = sqlite3.connect(f"{DB_PATH.as_uri()}?mode=ro", uri=True)
+    conn.execute("PRAGMA mmap_size = 268435456")
+    # Tables de dimension (quelques dizaines à milliers de lignes) chargées une fois
+    # en dictionnaires : la table Match est ensuite lue seule, sans jointure
+    leagues = dict(conn.execute("SELECT id, name FROM League"))
+    countries = dict(conn.execute(
+        "SELECT l.id, c.name FROM League AS l LEFT JOIN Country AS c ON l.country_id = c.id"
+    ))
+    teams = dict(conn.execute("SELECT team_api_id, team_long_name FROM Team"))
     query = """
-        SELECT
-            m.season,
-            l.name AS league_name,
-            c.name AS country_name,
-            th.team_long_name AS home_team,
-            ta.team_long_name AS away_team,
-            m.home_team_goal AS home_score,
-            m.away_team_goal AS away_score
-        FROM Match AS m
-        LEFT JOIN League AS l ON m.league_id = l.id
-        LEFT JOIN Country AS c ON l.country_id = c.id
-        LEFT JOIN Team AS th ON m.home_team_api_id = th.team_api_id
-        LEFT JOIN Team AS ta ON m.away_team_api_id = ta.team_api_id
-        WHERE m.season IS NOT NULL;
+        SELECT season, league_id, home_team_api_id, away_team_api_id,
+               home_team_goal AS home_score, away_team_goal AS away_score
+        FROM Match
+        WHERE season IS NOT NULL;
     """
-    df = pd.read_sql_query(query, conn)
-    # Basic cleanup: drop rows with missing team names
-    original_len = len(df)
-    df = df.dropna(subset=["home_team", "away_team"]).reset_index(drop=True)
-    print(f"ℹ️  Lignes sans nom d'équipe ignorées : {original_len - len(df)}")
-    conn.close()
-    df.to_csv(OUTPUT_PATH, index=False)
-    print(f"✅ {len(df)} matchs exportés vers {OUTPUT_PATH}")
+    # Schéma fixe : un lot sans ligue/pays connus garde des colonnes texte ;
+    # scores sur 8 bits, textes encodés par dictionnaire dans le fichier Parquet
+    schema = pa.schema([
+        ("season", pa.string()), ("league_name", pa.string()), ("country_name", pa.string()),
+        ("home_team", pa.string()), ("away_team", pa.string()),
+        ("home_score", pa.int8()), ("away_score", pa.int8()),
+    ]) if PYARROW_AVAILABLE else None
+    writer = pq.ParquetWriter(str(OUTPUT_PATH), schema, compression="snappy") if PYARROW_AVAILABLE else None
+
+    # Lecture et écriture par lots : jamais plus d'un lot de matchs en mémoire
+    original_len = kept = 0
+    try:
+        for i, chunk in enumerate(pd.read_sql_query(query, conn, chunksize=CHUNK_SIZE)):
+            original_len += len(chunk)
+            # Clés étrangères résolues par recherche dans les dictionnaires
+            chunk = pd.DataFrame({
+                "season": chunk["season"],
+                "league_name": chunk["league_id"].map(leagues),
+                "country_name": chunk["league_id"].map(countries),
+                "home_team": chunk["home_team_api_id"].map(teams),
+                "away_team": chunk["away_team_api_id"].map(teams),
+                "home_score": chunk["home_score"],
+                "away_score": chunk["away_score"],
+            })
+            # Basic cleanup: drop rows with missing team names
+            chunk = chunk.dropna(subset=["home_team", "away_team"])
+            kept += len(chunk)
+            if writer is not None:
+                writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+            else:
+                chunk.to_csv(OUTPUT_PATH, index=False, mode="w" if i == 0 else "a", header=i == 0)
+    finally:
+        if writer is not None:
+            writer.close()
+        conn.close()
+    print(f"ℹ️  Lignes sans nom d'équipe ignorées : {original_len - kept}")
+    print(f"✅ {kept} matchs exportés vers {OUTPUT_PATH}")
 
 if __name__ == "__main__":
-    extract_matches()
\ No newline at end of file
+    extract_matches()